@@ -0,0 +1,5 @@
+import time
+
+
+# Taken when the package is first imported, before app.main pulls in FastAPI and the rest.
+IMPORT_STARTED = time.perf_counter()
@@ -1,16 +1,31 @@
 import os
 import json
-from dotenv import load_dotenv
-from google import genai
+import threading
 from .taxonomy import get_taxonomy_prompt_list, get_issue_area
 from .database import get_cached_case, save_case
 
 
-load_dotenv()
+MODEL_ID = "gemini-2.0-flash"
 
 
-client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-MODEL_ID = "gemini-2.0-flash"
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the Gemini client, importing the SDK and creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from google import genai
+                _client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    return _client
+
+
+def is_client_ready() -> bool:
+    """Returns True once the Gemini client has been created."""
+    return _client is not None
 
 
 # Letter types configuration
@@ -63,7 +78,7 @@ Constituent message:
 Respond with JSON only, no markdown:
 {{"tier1": "...", "tier2": "...", "tier3": "...", "tier4": "..."}}"""
     
-    response = client.models.generate_content(
+    response = get_client().models.generate_content(
         model=MODEL_ID,
         contents=prompt
     )
@@ -103,7 +118,7 @@ Respond with JSON only, no markdown:
   ...
 ]}}"""
 
-    response = client.models.generate_content(
+    response = get_client().models.generate_content(
         model=MODEL_ID,
         contents=prompt
     )
@@ -136,7 +151,7 @@ Keep it under 100 words. Be professional but warm."""
 the status of a constituent's {tags['tier3']} case regarding {tags['tier4']}.
 Keep it under 100 words. Be formal and include a request for status update."""
     
-    response = client.models.generate_content(
+    response = get_client().models.generate_content(
         model=MODEL_ID,
         contents=prompt
     )
@@ -157,7 +172,7 @@ Message:
 
 Respond with exactly one word: positive, neutral, or negative"""
     
-    response = client.models.generate_content(
+    response = get_client().models.generate_content(
         model=MODEL_ID,
         contents=prompt
     )
@@ -239,7 +254,7 @@ Respond in this exact JSON format:
 """
 
     try:
-        response = client.models.generate_content(
+        response = get_client().models.generate_content(
             model=MODEL_ID,
             contents=[prompt]
         )
@@ -289,7 +304,7 @@ Keep the letter professional, concise (under 200 words), and appropriate for a c
 Respond with the letter text only, no JSON or markdown."""
 
         try:
-            response = client.models.generate_content(
+            response = get_client().models.generate_content(
                 model=MODEL_ID,
                 contents=prompt
             )
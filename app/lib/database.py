@@ -1,11 +1,39 @@
 import aiosqlite
-import json
+import orjson
 import os
+import secrets
 
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "casework.db")
 
 
+# Bump when stored column encodings change; see migrate_db().
+SCHEMA_VERSION = 1
+
+CASE_FIELDS = ("id", "subject", "body", "tags", "issue_area", "sentiment", "actions", "action_plan", "drafts")
+JSON_FIELDS = {"tags", "actions", "action_plan", "drafts"}
+
+
+def encode(value) -> bytes:
+    """Encode a JSON column as compact orjson bytes."""
+    return orjson.dumps(value)
+
+
+def decode(value, default=None):
+    """Decode a JSON column; handles both orjson BLOBs and legacy json text."""
+    if not value:
+        return default
+    return orjson.loads(value)
+
+
+def row_to_case(row, fields=CASE_FIELDS) -> dict:
+    """Build a case dict from a row, decoding only the requested JSON fields."""
+    return {
+        field: decode(row[field], [] if field == "action_plan" else None) if field in JSON_FIELDS else row[field]
+        for field in fields
+    }
+
+
 
 async def init_db():
     """Initialize the database and create tables."""
@@ -24,10 +52,70 @@ async def init_db():
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        await db.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('cases_version', 0)")
+        # Random per-database id, so a recreated database never reuses an old version's ETag.
+        await db.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('db_id', ?)", (secrets.randbits(63),)
+        )
+        await migrate_db(db)
         await db.commit()
 
 
 
+async def bump_cases_version(db):
+    """Increment the cases version; call inside the transaction that changes cases."""
+    await db.execute("UPDATE meta SET value = value + 1 WHERE key = 'cases_version'")
+
+
+
+async def get_cases_version() -> str:
+    """Get the database id and version counter used to build ETags for case reads."""
+    async with aiosqlite.connect(DB_PATH) as db:
+        async with db.execute(
+            "SELECT key, value FROM meta WHERE key IN ('db_id', 'cases_version')"
+        ) as cursor:
+            meta = dict(await cursor.fetchall())
+            return f"{meta.get('db_id', 0):x}-{meta.get('cases_version', 0)}"
+
+
+
+async def migrate_db(db):
+    """Re-encode rows written by older versions into the current storage format."""
+    async with db.execute("PRAGMA user_version") as cursor:
+        version = (await cursor.fetchone())[0]
+    
+    if version < 1:
+        # v0 stored JSON columns as json.dumps text; v1 stores compact orjson BLOBs.
+        async with db.execute(
+            "SELECT id, tags, actions, action_plan, drafts FROM cases WHERE typeof(tags) = 'text'"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        await db.executemany(
+            "UPDATE cases SET tags = ?, actions = ?, action_plan = ?, drafts = ? WHERE id = ?",
+            [
+                (
+                    encode(decode(tags)),
+                    encode(decode(actions)),
+                    encode(decode(action_plan, [])),
+                    encode(decode(drafts)),
+                    case_id,
+                )
+                for case_id, tags, actions, action_plan, drafts in rows
+            ]
+        )
+        print(f"Migrated {len(rows)} cases to compact storage")
+    
+    if version < SCHEMA_VERSION:
+        await db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+
 async def get_cached_case(case_id: str, subject: str, body: str):
     """Check if case exists with same content."""
     async with aiosqlite.connect(DB_PATH) as db:
@@ -38,15 +126,7 @@ async def get_cached_case(case_id: str, subject: str, body: str):
         ) as cursor:
             row = await cursor.fetchone()
             if row:
-                return {
-                    "id": row["id"],
-                    "tags": json.loads(row["tags"]),
-                    "issue_area": row["issue_area"],
-                    "sentiment": row["sentiment"],
-                    "actions": json.loads(row["actions"]),
-                    "action_plan": json.loads(row["action_plan"]) if row["action_plan"] else [],
-                    "drafts": json.loads(row["drafts"]),
-                }
+                return row_to_case(row, ("id", "tags", "issue_area", "sentiment", "actions", "action_plan", "drafts"))
     return None
 
 
@@ -62,37 +142,26 @@ async def save_case(result: dict, subject: str, body: str):
             result["id"],
             subject,
             body,
-            json.dumps(result["tags"]),
+            encode(result["tags"]),
             result["issue_area"],
             result["sentiment"],
-            json.dumps(result["actions"]),
-            json.dumps(result.get("action_plan", [])),
-            json.dumps(result["drafts"]),
+            encode(result["actions"]),
+            encode(result.get("action_plan", [])),
+            encode(result["drafts"]),
         ))
+        await bump_cases_version(db)
         await db.commit()
 
 
 
-async def get_all_cases():
-    """Get all saved cases."""
+async def get_all_cases(fields=CASE_FIELDS):
+    """Get all saved cases, selecting and decoding only the given fields."""
+    columns = ", ".join(fields)
     async with aiosqlite.connect(DB_PATH) as db:
         db.row_factory = aiosqlite.Row
-        async with db.execute("SELECT * FROM cases ORDER BY created_at DESC") as cursor:
+        async with db.execute(f"SELECT {columns} FROM cases ORDER BY created_at DESC") as cursor:
             rows = await cursor.fetchall()
-            return [
-                {
-                    "id": row["id"],
-                    "subject": row["subject"],
-                    "body": row["body"],
-                    "tags": json.loads(row["tags"]),
-                    "issue_area": row["issue_area"],
-                    "sentiment": row["sentiment"],
-                    "actions": json.loads(row["actions"]),
-                    "action_plan": json.loads(row["action_plan"]) if row["action_plan"] else [],
-                    "drafts": json.loads(row["drafts"]),
-                }
-                for row in rows
-            ]
+            return [row_to_case(row, fields) for row in rows]
 
 
 async def advance_case_step(case_id: str) -> dict | None:
@@ -109,8 +178,8 @@ async def advance_case_step(case_id: str) -> dict | None:
         if not row:
             return None
         
-        action_plan = json.loads(row["action_plan"]) if row["action_plan"] else []
-        drafts = json.loads(row["drafts"])
+        action_plan = decode(row["action_plan"], [])
+        drafts = decode(row["drafts"])
         
         # Find and complete the next pending OR waiting step
         completed_step = None
@@ -137,19 +206,14 @@ async def advance_case_step(case_id: str) -> dict | None:
             """UPDATE cases 
                SET action_plan = ?, drafts = ?
                WHERE id = ?""",
-            (json.dumps(action_plan), json.dumps(drafts), case_id)
+            (encode(action_plan), encode(drafts), case_id)
         )
+        if completed_step:
+            await bump_cases_version(db)
         await db.commit()
         
         # Return full case data
-        return {
-            "id": row["id"],
-            "subject": row["subject"],
-            "body": row["body"],
-            "tags": json.loads(row["tags"]),
-            "issue_area": row["issue_area"],
-            "sentiment": row["sentiment"],
-            "actions": json.loads(row["actions"]),
-            "action_plan": action_plan,
-            "drafts": drafts,
-        }
+        case = row_to_case(row, ("id", "subject", "body", "tags", "issue_area", "sentiment", "actions"))
+        case["action_plan"] = action_plan
+        case["drafts"] = drafts
+        return case
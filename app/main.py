@@ -1,20 +1,32 @@
 import os
+import time
+import zlib
+import asyncio
+import hashlib
+import orjson
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from dotenv import load_dotenv
 
-from .lib.agent import run_agent_for_case, generate_stage_drafts
+from . import IMPORT_STARTED
+from .lib.agent import run_agent_for_case, generate_stage_drafts, get_client, is_client_ready
 from .lib.sample_cases import SAMPLE_CASES
-from .lib.database import init_db, get_all_cases, advance_case_step
+from .lib.database import init_db, get_all_cases, advance_case_step, get_cases_version, CASE_FIELDS
 
 
 load_dotenv()
 
 
 IS_PRODUCTION = os.getenv("ENVIRONMENT") == "production"
+WARM_MODEL_CLIENT = os.getenv("WARM_MODEL_CLIENT", "true").lower() != "false"
+
+
+startup_seconds = None
 
 
 daily_calls = {}
@@ -38,14 +50,51 @@ def check_daily_limit(ip: str) -> bool:
     return True
 
 
+def etag_matches(request: Request, etag: str) -> bool:
+    """Returns True if the request's If-None-Match header matches the ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+SAMPLE_CASES_BODY = orjson.dumps({"cases": SAMPLE_CASES})
+SAMPLE_CASES_ETAG = f'W/"samples-{hashlib.sha1(SAMPLE_CASES_BODY).hexdigest()[:16]}"'
+
+
+async def warm_up_client():
+    """Create the Gemini client off the event loop so the first request doesn't pay for it."""
+    started = time.perf_counter()
+    try:
+        await asyncio.to_thread(get_client)
+        print(f"Model client ready in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        print(f"Model client warm-up failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global startup_seconds
     await init_db()
     print(f"Database initialized. Environment: {'production' if IS_PRODUCTION else 'development'}")
+    
+    warm_up_task = asyncio.create_task(warm_up_client()) if WARM_MODEL_CLIENT else None
+    
+    startup_seconds = time.perf_counter() - IMPORT_STARTED
+    print(f"Startup complete in {startup_seconds:.2f}s (model warm-up: {'background' if warm_up_task else 'on first use'})")
     yield
+    
+    if warm_up_task and not warm_up_task.done():
+        warm_up_task.cancel()
 
 
-app = FastAPI(title="Caseworker Agent API", lifespan=lifespan)
+app = FastAPI(title="Caseworker Agent API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 app.add_middleware(
@@ -54,9 +103,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+
 class CaseInput(BaseModel):
     id: str
     subject: str
@@ -68,15 +121,47 @@ def root():
     return {"status": "ok", "message": "Caseworker Agent API"}
 
 
+@app.get("/health")
+def health():
+    return {
+        "status": "ok",
+        "model_ready": is_client_ready(),
+        "startup_seconds": round(startup_seconds, 3) if startup_seconds is not None else None,
+    }
+
+
 @app.get("/sample-cases")
-def get_sample_cases():
-    return {"cases": SAMPLE_CASES}
+def get_sample_cases(request: Request):
+    if etag_matches(request, SAMPLE_CASES_ETAG):
+        return not_modified(SAMPLE_CASES_ETAG)
+    
+    return Response(
+        content=SAMPLE_CASES_BODY,
+        media_type="application/json",
+        headers={"ETag": SAMPLE_CASES_ETAG, "Cache-Control": "no-cache"}
+    )
 
 
 @app.get("/cases")
-async def get_cases():
-    cases = await get_all_cases()
-    return {"cases": cases}
+async def get_cases(request: Request, fields: Optional[str] = None):
+    if fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in requested if f not in CASE_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        selected = tuple(f for f in CASE_FIELDS if f == "id" or f in requested)
+    else:
+        selected = CASE_FIELDS
+    
+    # Read the version before the rows: a concurrent write can only make the ETag stale, never hide a change.
+    version = await get_cases_version()
+    etag = f'W/"cases-{version}-{zlib.crc32(",".join(selected).encode()):08x}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    cases = await get_all_cases(selected)
+    # Returned directly so the cases skip jsonable_encoder and go straight to orjson.
+    return ORJSONResponse({"cases": cases}, headers={"ETag": etag, "Cache-Control": "no-cache"})
 
 
 @app.post("/run-agent")
@@ -19,25 +19,39 @@ const runSingleAgentBtn = document.getElementById("runSingleAgent");
 
 
 let currentResults = [];
+const etagCache = new Map();
 
 
-loadSampleBtn.addEventListener("click", async () => {
-  const res = await fetch(`${API_URL}/sample-cases`);
+async function fetchWithETag(url, options = {}) {
+  const cached = etagCache.get(url);
+  const headers = { ...(options.headers || {}) };
+  if (cached) headers["If-None-Match"] = cached.etag;
+
+  const res = await fetch(url, { ...options, headers, cache: "no-store" });
+  if (res.status === 304 && cached) return cached.data;
+
   const data = await res.json();
+  const etag = res.headers.get("ETag");
+  if (res.ok && etag) etagCache.set(url, { etag, data });
+  return data;
+}
+
+
+loadSampleBtn.addEventListener("click", async () => {
+  const data = await fetchWithETag(`${API_URL}/sample-cases`);
   inputJson.value = JSON.stringify(data.cases, null, 2);
 });
 
 
 loadSavedBtn.addEventListener("click", async () => {
-  const res = await fetch(`${API_URL}/cases`);
-  const data = await res.json();
+  const data = await fetchWithETag(`${API_URL}/cases`);
 
   if (data.cases.length === 0) {
     alert("No saved cases yet. Run the agent first.");
     return;
   }
 
-  currentResults = data.cases;
+  currentResults = [...data.cases];
   renderResults();
   renderHotTopics();
 });